@@ -13,4 +13,5 @@ from django_queryparams_parser.params import (
     Str,
     Bool,
     Date,
+    param,
 )
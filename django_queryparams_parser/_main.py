@@ -1,6 +1,8 @@
-from collections import defaultdict
+from functools import lru_cache
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.urls import path as _path
 from django.urls.resolvers import URLPattern
 
@@ -8,6 +10,8 @@ from django_queryparams_parser.params import QueryParam, InvalidQueryParameter
 
 
 class QueryParamGroup:
+    __slots__ = ("query_params",)
+
     def __init__(self, query_params):
         for qp in query_params:
             if not isinstance(qp, QueryParam):
@@ -20,27 +24,35 @@ class _QueryParams:
         self.mapping = {}
         self.view_func_qps = {}
 
-    def map(self, pattern, params):
-        qps = validate_query_params(params)
-        self.mapping[pattern] = qps
-
-    def validate(self, path, query_dict):
-        # TODO: Optimize
-        parsed, errors = defaultdict(list), []
-        for pattern, declared_query_params in self.mapping.items():
-            # REVIEW: Use view func instead of url to identify and validate the query params
-            if pattern.match(path.lstrip("/")):
-                for param in declared_query_params:
-                    if param.name in query_dict:
-                        try:
-                            parsed[param.name].extend(
-                                param.validate_all(query_dict.getlist(param.name))
-                            )
-                        except InvalidQueryParameter as exc:
-                            errors.append(f"{str(exc)}: {param.name}")
-                    elif param.required:
-                        errors.append(f"Missing required query param: {param.name}")
-        return parsed, errors
+    def map(self, view, route, params):
+        self.register(view, route, validate_query_params(params))
+
+    def register(self, view, route, query_params):
+        """
+        Register the query params declared for the `route` to `view`.
+
+        The params are keyed by the view callback so the request path needn't be
+        matched against every registered pattern, and then by the route so one
+        view can be routed with different params. Routes without params are kept
+        too, so another route to the view isn't mistaken for them.
+        """
+        validator = compile_validator(query_params) if query_params else None
+        self.mapping.setdefault(view, {})[route] = validator
+
+    def validate(self, view, route, query_dict):
+        routes = self.mapping.get(view)
+        if routes is None:
+            return {}, []
+        if route in routes:
+            validator = routes[route]
+        else:
+            # `route` also carries the prefixes of the include()s the pattern is
+            # nested in, pick the longest registered route it ends with
+            matches = [r for r in routes if route.endswith(r.lstrip("^"))]
+            validator = routes[max(matches, key=len)] if matches else None
+        if validator is None:
+            return {}, []
+        return validator(query_dict)
 
 
 def validate_query_params(params):
@@ -54,7 +66,49 @@ def validate_query_params(params):
             raise TypeError(
                 f"expected QueryParam or QueryParamGroup, received {type(param)}"
             )
-    return qps
+    # Required params first, so a missing one is reported before parsing the rest
+    qps.sort(key=lambda qp: not qp.required)
+    # Read-only after registration
+    return tuple(qps)
+
+
+def compile_validator(query_params):
+    """
+    Generate a function validating a QueryDict against `query_params`.
+
+    The declared params are fixed once the URLconf is loaded, so the loop over
+    them is unrolled into straight-line code with the names inlined as literals.
+    """
+    namespace = {"settings": settings, "InvalidQueryParameter": InvalidQueryParameter}
+    lines = [
+        "def validate(query_dict):",
+        "    parsed, errors = {}, []",
+        "    getlist = query_dict.getlist",
+    ]
+    for i, param in enumerate(query_params):
+        name = param.name
+        namespace[f"validate_all_{i}"] = param.validate_all
+        # `getlist` returns [] for absent keys, no separate `in` check needed
+        lines += [
+            f"    values = getlist({name!r})",
+            "    if values:",
+            "        try:",
+            f"            parsed[{name!r}] = validate_all_{i}(values)",
+            "        except InvalidQueryParameter as exc:",
+            f"            errors.append(str(exc) + {': ' + name!r})",
+        ]
+        if param.required:
+            lines += [
+                "    else:",
+                f"        errors.append({'Missing required query param: ' + name!r})",
+                # Without DEBUG the response carries no details, so stop here
+                "        if not settings.DEBUG:",
+                "            return parsed, errors",
+            ]
+    lines.append("    return parsed, errors")
+
+    exec(compile("\n".join(lines), "<query params validator>", "exec"), namespace)
+    return namespace["validate"]
 
 
 QueryParams = _QueryParams()
@@ -63,17 +117,20 @@ QueryParams = _QueryParams()
 
 
 def _save_pathqueries(urlpattern, query_params):
+    view, route = urlpattern.callback, str(urlpattern.pattern)
     if query_params and len(query_params) > 0:
-        QueryParams.map(urlpattern.pattern, query_params)
+        QueryParams.map(view, route, query_params)
         return
 
-    # Check if the query_params are added at the view level
-    ids = collect_function_ids(urlpattern.callback)
-    for id_, qps in list(QueryParams.view_func_qps.items()):
-        if id_ in ids:
-            QueryParams.mapping[urlpattern.pattern] = qps
-            del QueryParams.view_func_qps[id_]
-            break
+    # Check if the query_params are added at the view level. Kept in
+    # `view_func_qps` so the view can be routed more than once
+    ids = collect_function_ids(view)
+    for func, qps in QueryParams.view_func_qps.items():
+        if id(func) in ids:
+            QueryParams.register(view, route, qps)
+            return
+
+    QueryParams.register(view, route, ())
 
 
 def path(url, view, *, query_params=None, **kwargs):
@@ -103,13 +160,16 @@ def parse_query_params(query_params):
         if _middleware_disabled():
             return view
 
-        QueryParams.view_func_qps[id(view)] = validate_query_params(query_params)
+        QueryParams.view_func_qps[view] = validate_query_params(query_params)
 
         return view
 
     return wrapper
 
 
+# MIDDLEWARE is fixed once settings are loaded, no need to rescan it per `path()`.
+# Only overridden settings (e.g. in tests) change it, see below
+@lru_cache(maxsize=None)
 def _middleware_disabled():
     return (
         "django_queryparams_parser.middleware.QueryParamsParser"
@@ -117,14 +177,21 @@ def _middleware_disabled():
     )
 
 
+@receiver(setting_changed)
+def _reset_middleware_disabled(*, setting, **kwargs):
+    if setting == "MIDDLEWARE":
+        _middleware_disabled.cache_clear()
+
+
 def collect_function_ids(func):
-    """Recursively collect the id() of inner functions"""
-    ids = [id(func)]
+    """Collect the id() of the function and of all the inner functions it wraps"""
+    ids, stack = {id(func)}, [func]
 
-    if hasattr(func, "__closure__"):
-        for cell in func.__closure__ or []:
+    while stack:
+        for cell in getattr(stack.pop(), "__closure__", None) or []:
             inner_func = cell.cell_contents
-            if callable(inner_func):
-                ids.extend(collect_function_ids(inner_func))
+            if callable(inner_func) and id(inner_func) not in ids:
+                ids.add(id(inner_func))
+                stack.append(inner_func)
 
     return ids
@@ -5,10 +5,23 @@ from django.utils.datastructures import MultiValueDict
 from django_queryparams_parser._main import QueryParams
 
 
-def QueryParamsParser(get_response):
-    def parser(request):
-        parsed, errors = QueryParams.validate(request.path, request.GET)
-        print("Parse status\n", parsed, "\n", errors)
+class QueryParamsParser:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not QueryParams.mapping:
+            request.parsed_query_params = MultiValueDict()
+            return None
+
+        # Django has already resolved the view by now, reuse it for the lookup
+        # instead of resolving the path a second time
+        parsed, errors = QueryParams.validate(
+            view_func, request.resolver_match.route, request.GET
+        )
         if errors:
             if settings.DEBUG:
                 # return DetailedReport
@@ -16,8 +29,6 @@ def QueryParamsParser(get_response):
             # TODO: Choose json or template response using content negotiation
             return HttpResponseBadRequest()
             # TODO: log the errors
+        # Always a fresh, mutable instance, views may fill in defaults
         request.parsed_query_params = MultiValueDict(parsed)
-        resp = get_response(request)
-        return resp
-
-    return parser
+        return None
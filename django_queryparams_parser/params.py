@@ -1,15 +1,18 @@
+import ast
+import re
 from datetime import date
-from inspect import signature
+from functools import lru_cache
+from inspect import CO_VARARGS, CO_VARKEYWORDS, getsource, signature
+from textwrap import dedent
+from types import FunctionType
 
 # Notes:
-# 1. Do defensive programming in `__init__`
+# 1. Do defensive programming in `__init__`, with the argument type checks under
+#    `if __debug__:` so that running with `python -O` strips them
 # 2. Write performant code in `validate`
 # 3. Use stdlib functions to parse and/or validate. Use regex only if it's faster.
 
 # Performance improvement ideas:
-# - Use Metaclasses to dynamically create efficient classes at initialization time
-# - Improve validation performance by dynamically clubbing
-#   function source codes to reduce function call overhead
 # - Replace list comprehensions or for-loops with map and filter
 
 # TODO:
@@ -17,7 +20,6 @@ from inspect import signature
 # - Define DateTime
 # - Prefix/suffix query param name in all exception messages
 # - Implement QueryParamGroup
-# - Optimize QueryParam memory usage, use slots?
 # - Add annotations
 # - Add extensive docstrings
 # - Define UUID
@@ -28,6 +30,13 @@ from inspect import signature
 # 2. Extend `QueryParam` class and define `validate` method
 
 
+# Prefixes rejected by `Number`, matching on the prefix also covers floats.
+# `int()`/`float()` skip surrounding whitespace and accept `_` between digits,
+# so " 01" and "0_1" are lead zeros too
+_LEAD_ZEROS = re.compile(r"\s*[+-]?0[\d_]").match
+_PLUS_SIGN_OR_LEAD_ZEROS = re.compile(r"\s*(?:\+|-?0[\d_])").match
+
+
 class QueryParamError(Exception):
     pass
 
@@ -36,7 +45,154 @@ class InvalidQueryParameter(QueryParamError):
     pass
 
 
-class QueryParam:
+def _count_parameters(func):
+    """Same as `len(signature(func).parameters)`, without building the signature"""
+    # `signature` follows `__wrapped__` and handles partials and bound methods
+    if isinstance(func, FunctionType) and not hasattr(func, "__wrapped__"):
+        code = func.__code__
+        return (
+            code.co_argcount
+            + code.co_kwonlyargcount
+            + bool(code.co_flags & CO_VARARGS)
+            + bool(code.co_flags & CO_VARKEYWORDS)
+        )
+    return len(signature(func).parameters)
+
+
+def _inlinable(check):
+    """Mark a `(self, value, parsed)` check method as safe to club into one function"""
+    check.inlinable = True
+    return check
+
+
+class _HoistSelfAttrs(ast.NodeTransformer):
+    """Rewrite `self.<attr>` reads to plain names, collecting the attr names"""
+
+    def __init__(self):
+        self.attrs = {}
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == "self"
+            and isinstance(node.ctx, ast.Load)
+        ):
+            self.attrs[node.attr] = None
+            return ast.copy_location(ast.Name(id=node.attr, ctx=ast.Load()), node)
+        return node
+
+
+# Bound by the clubbed function itself, inlined checks mustn't rebind or hoist them
+_CLUBBED_NAMES = frozenset({"self", "parse", "validate", "value", "parsed"})
+
+# Statements that don't carry over from a check's body into the clubbed function
+_UNCLUBBABLE_NODES = (ast.Return, ast.Yield, ast.YieldFrom, ast.Global, ast.Nonlocal)
+
+
+def _can_club(check, func_def):
+    """Whether the body of `check` can be spliced into the clubbed function as is"""
+    # The clubbed function looks up globals in this module
+    if check.__globals__ is not globals():
+        return False
+    if [arg.arg for arg in func_def.args.args] != ["self", "value", "parsed"]:
+        return False
+    for stmt in func_def.body:
+        for node in ast.walk(stmt):
+            if isinstance(node, _UNCLUBBABLE_NODES):
+                return False
+            if (
+                isinstance(node, ast.Name)
+                and not isinstance(node.ctx, ast.Load)
+                and node.id in _CLUBBED_NAMES
+            ):
+                return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _club_checks(checks):
+    """
+    Club `parse` and the bodies of the `checks` functions into a single function.
+
+    Returns a factory which, given the param, returns a `validate(value)`
+    function parsing the value and running all the checks inline, with
+    `self.<attr>` reads hoisted into closure variables. Returns None if a check
+    can't be inlined as is. Cached per combination of checks.
+    """
+    hoist = _HoistSelfAttrs()
+    body = []
+    for check in checks:
+        func_def = ast.parse(dedent(getsource(check))).body[0]
+        if not _can_club(check, func_def):
+            return None
+        body.extend(hoist.visit(stmt) for stmt in func_def.body)
+
+    # Hoisted attrs must neither clash with the clubbed function's own names nor
+    # be rebound by a check, which would make them local to `validate`
+    stored = {
+        node.id
+        for stmt in body
+        for node in ast.walk(stmt)
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load)
+    }
+    if not hoist.attrs.keys().isdisjoint(_CLUBBED_NAMES | stored):
+        return None
+
+    tree = ast.parse(
+        "def factory(self):\n"
+        "    parse = self._specialized_parse()\n"
+        "    def validate(value):\n"
+        "        parsed = parse(value)\n"
+        "        return parsed\n"
+        "    return validate\n"
+    )
+    factory = tree.body[0]
+    factory.body[1].body[1:1] = body
+    factory.body[:0] = [
+        ast.parse(f"{attr} = self.{attr}").body[0] for attr in hoist.attrs
+    ]
+    ast.fix_missing_locations(tree)
+
+    namespace = dict(globals())
+    exec(compile(tree, "<clubbed checks>", "exec"), namespace)
+    return namespace["factory"]
+
+
+def _lookup_choice(choice_map, validate):
+    """Return the parsed choice for an exact match, falling back to `validate`"""
+    get = choice_map.get
+    missing = object()
+
+    def lookup(value):
+        parsed = get(value, missing)
+        if parsed is missing:
+            return validate(value)
+        return parsed
+
+    return lookup
+
+
+class QueryParamMeta(type):
+    """Specializes the validation once the param is fully initialized"""
+
+    def __call__(cls, *args, **kwargs):
+        param = super().__call__(*args, **kwargs)
+        param._specialize()
+        return param
+
+
+class QueryParam(metaclass=QueryParamMeta):
+    __slots__ = (
+        "name",
+        "required",
+        "many",
+        "choices",
+        "_choice_map",
+        "_value_checks",
+        "_validate",
+    )
+
     def __init__(
         self,
         name,
@@ -46,42 +202,51 @@ class QueryParam:
         choices=None,
         validators=None,
     ):
-        if not isinstance(name, str):
-            raise TypeError(f"'name' must be string, not {type(name)}")
+        if __debug__:
+            if not isinstance(name, str):
+                raise TypeError(f"'name' must be string, not {type(name)}")
+            if not isinstance(required, bool):
+                raise TypeError(f"'required' must be a bool, not {type(required)}")
+            if not isinstance(many, bool):
+                raise TypeError(f"'many' must be a bool, not {type(many)}")
+            if choices is not None:
+                if not isinstance(choices, (tuple, list)):
+                    raise TypeError(
+                        f"'choices' must be a list/tuple, not {type(choices)}"
+                    )
+                if not all(isinstance(c, str) for c in choices):
+                    raise TypeError("choices must be strings")
+            if validators is not None and not isinstance(validators, (tuple, list)):
+                raise TypeError(
+                    f"'validators' must be a list/tuple, not '{type(validators)}'"
+                )
+
         self.name = name
 
         self._value_checks = []
+        # Replaced by the clubbed parse and checks in `_specialize`
+        self._validate = self.validate_single
 
-        if not isinstance(required, bool):
-            raise TypeError(f"'required' must be a bool, not {type(required)}")
         self.required = required
-
-        if not isinstance(many, bool):
-            raise TypeError(f"'many' must be a bool, not {type(many)}")
         self.many = many
 
         if choices is not None and validators is not None:
             raise ValueError("Only one of 'choices' or 'validators' is allowed")
 
+        # Raw choice -> parsed value, see `_specialize`. The choices are only
+        # parsed, they needn't pass the other checks
+        self._choice_map = None
         if choices is not None:
-            if not isinstance(choices, (tuple, list)):
-                raise TypeError(f"'choices' must be a list/tuple, not {type(choices)}")
-            if not all(isinstance(c, str) for c in choices):
-                raise TypeError("choices must be strings")
-            choices = self._validate_choices(choices)
+            self._choice_map = {choice: self.parse(choice) for choice in choices}
+            choices = self._freeze_choices(self._choice_map.values())
             self._value_checks.append(self._check_one_of_choices)
-        self.choices = choices or set()
+        self.choices = choices or frozenset()
 
         if validators is not None:
-            if not isinstance(validators, (tuple, list)):
-                raise TypeError(
-                    f"'validators' must be a list/tuple, not '{type(validators)}'"
-                )
             for validator in validators:
                 if not callable(validator):
                     raise ValueError(f"Validator {validator.__name__} is not callable")
-                sig = signature(validator)
-                if len(sig.parameters) != 2:
+                if _count_parameters(validator) != 2:
                     raise ValueError(
                         f"Validator {validator.__name__} must have exactly two parameters"
                     )
@@ -89,33 +254,73 @@ class QueryParam:
 
     def validate_single(self, value):
         parsed = self.parse(value)
-        self._check(value, parsed)
+        for val_check in self._value_checks:
+            val_check(value, parsed)
         return parsed
 
     def validate_all(self, values):
-        if self.many or len(values) == 1:
-            return [self.validate_single(value) for value in values]
-        else:
-            raise InvalidQueryParameter(f"Expected 1 value, got {len(values)}")
-
-    # REVIEW: different `validate` function when choices are given, directly do 'in' check
+        count = len(values)
+        if self.many or count == 1:
+            return list(map(self._validate, values))
+        raise InvalidQueryParameter(f"Expected 1 value, got {count}")
 
     def parse(self, value):
         raise NotImplementedError("implement in child classes")
 
-    def _check(self, value, parsed):
-        for val_check in self._value_checks:
-            val_check(value, parsed)
-
-    def _validate_choices(self, choices):
-        return {self.validate_single(choice) for choice in choices}
-
+    def _specialized_parse(self):
+        """`parse`, or an equivalent function the clubbed checks can call instead"""
+        return self.parse
+
+    def _specialize(self):
+        # Checks are final once the param is initialized
+        checks = self._value_checks = tuple(self._value_checks)
+        # Keep using an overridden `validate_single` as is
+        if type(self).validate_single is not QueryParam.validate_single:
+            return
+
+        # User validators can't be inlined, keep looping over them
+        if all(getattr(check, "inlinable", False) for check in checks):
+            try:
+                factory = _club_checks(tuple(check.__func__ for check in checks))
+            except (OSError, TypeError):  # source not available
+                factory = None
+            if factory is not None:
+                self._validate = factory(self)
+
+        if self._choice_map:
+            validate = self._validate
+            # Values spelled exactly like a choice needn't be parsed and checked,
+            # unless the choice itself fails the other checks (e.g. lead zeros)
+            choice_map = {}
+            for choice, parsed in self._choice_map.items():
+                try:
+                    validate(choice)
+                except InvalidQueryParameter:
+                    continue
+                choice_map[choice] = parsed
+            self._validate = _lookup_choice(choice_map, validate)
+
+    def _freeze_choices(self, parsed_choices):
+        parsed = set(parsed_choices)
+        # Scanning a handful of choices is cheaper than hashing the value
+        return tuple(parsed) if len(parsed) <= 4 else frozenset(parsed)
+
+    @_inlinable
     def _check_one_of_choices(self, value, parsed):
         if parsed not in self.choices:
             raise InvalidQueryParameter()
 
 
 class BoundedParam(QueryParam):
+    __slots__ = ("min_value", "max_value")
+
+    # (min_value given, max_value given) -> check
+    _BOUND_CHECKS = {
+        (True, True): "_check_upper_and_lower_bounds",
+        (True, False): "_check_lower_bound",
+        (False, True): "_check_upper_bound",
+    }
+
     def __init__(self, name, *, min_value=None, max_value=None, **kwargs):
         super().__init__(name, **kwargs)
 
@@ -124,33 +329,57 @@ class BoundedParam(QueryParam):
                 "'min_value' and/or 'max_value' can't be clubbed with 'choices'"
             )
 
-        self.min_value = None if min_value is None else self.validate_single(min_value)
-        self.max_value = None if max_value is None else self.validate_single(max_value)
+        # Bounds aren't subject to the value checks, only parse them
+        self.min_value = self._parse_bound("min_value", min_value)
+        self.max_value = self._parse_bound("max_value", max_value)
 
-        if (self.min_value and self.max_value) and self.max_value < self.min_value:
+        if (
+            self.min_value is not None
+            and self.max_value is not None
+            and self.max_value < self.min_value
+        ):
             raise ValueError("'max_value' must be >= 'min_value'")
 
-        if min_value is not None and max_value is not None:
-            self._value_checks.append(self._check_upper_and_lower_bounds)
-        elif min_value is not None:
-            self._value_checks.append(self._check_lower_bound)
-        elif max_value is not None:
-            self._value_checks.append(self._check_upper_bound)
+        check = self._BOUND_CHECKS.get((min_value is not None, max_value is not None))
+        if check:
+            self._value_checks.append(getattr(self, check))
 
-    def check_lower_bound(self, value, parsed):
-        if not parsed > self.min_value:
+    def _parse_bound(self, arg_name, bound):
+        # Bounds may be given as strings or as values, `parse` expects the former
+        if bound is None:
+            return None
+        try:
+            return self.parse(str(bound))
+        except InvalidQueryParameter:
+            raise ValueError(f"Invalid '{arg_name}': {bound!r}") from None
+
+    # Bounds are inclusive
+    @_inlinable
+    def _check_lower_bound(self, value, parsed):
+        if parsed < self.min_value:
             raise InvalidQueryParameter()
 
-    def check_upper_bound(self, value, parsed):
-        if not parsed < self.max_value:
+    @_inlinable
+    def _check_upper_bound(self, value, parsed):
+        if parsed > self.max_value:
             raise InvalidQueryParameter()
 
-    def check_upper_and_lower_bounds(self, value, parsed):
-        if not (self.min_value <= parsed <= self.max_value):
+    @_inlinable
+    def _check_upper_and_lower_bounds(self, value, parsed):
+        if parsed < self.min_value or parsed > self.max_value:
             raise InvalidQueryParameter()
 
 
 class Number(BoundedParam):
+    __slots__ = ()
+
+    # (allow_lead_zeros, allow_plus_sign) -> check
+    _SIGN_CHECKS = {
+        (False, False): "_check_lead_zeros_and_plus_sign",
+        (False, True): "_check_lead_zeros",
+        (True, False): "_check_plus_sign",
+    }
+
     def __init__(
         self,
         name,
@@ -161,110 +390,111 @@ class Number(BoundedParam):
     ):
         super().__init__(name, **kwargs)
 
-        if not isinstance(allow_lead_zeros, bool):
-            raise TypeError(
-                f"'allow_lead_zeros' must be a bool, not '{type(allow_lead_zeros)}'"
-            )
-
-        if not isinstance(allow_plus_sign, bool):
-            raise TypeError(
-                f"'allow_plus_sign' must be a bool, not '{type(allow_plus_sign)}'"
-            )
+        if __debug__:
+            if not isinstance(allow_lead_zeros, bool):
+                raise TypeError(
+                    f"'allow_lead_zeros' must be a bool, not '{type(allow_lead_zeros)}'"
+                )
+            if not isinstance(allow_plus_sign, bool):
+                raise TypeError(
+                    f"'allow_plus_sign' must be a bool, not '{type(allow_plus_sign)}'"
+                )
 
-        if (not allow_lead_zeros) and (not allow_plus_sign):
-            self._value_checks.append(self._check_lead_zeros_and_plus_sign)
-        elif not allow_lead_zeros:
-            self._value_checks.append(self._check_lead_zeros)
-        elif not allow_plus_sign:
-            self._value_checks.append(self._check_plus_sign)
+        check = self._SIGN_CHECKS.get((allow_lead_zeros, allow_plus_sign))
+        if check:
+            self._value_checks.append(getattr(self, check))
 
-    def check_lead_zeros(self, value, parsed):
-        if value[0] in ("+", "-") and value[1:2] == ["0"] and len(value) > 2:
-            raise InvalidQueryParameter()
-        elif value[0] == "0" and len(value) > 1:
+    @_inlinable
+    def _check_lead_zeros(self, value, parsed):
+        if _LEAD_ZEROS(value):
             raise InvalidQueryParameter()
 
-    def check_plus_sign(self, value, parsed):
-        if value[0] == "+":
+    @_inlinable
+    def _check_plus_sign(self, value, parsed):
+        if value.lstrip().startswith("+"):
             raise InvalidQueryParameter()
 
-    def check_lead_zeros_and_plus_sign(self, value, parsed):
-        if value[0] == "+":
-            raise InvalidQueryParameter()
-        elif value[0] == "0" and value != "0":
-            raise InvalidQueryParameter()
-        elif value != "-0":
+    @_inlinable
+    def _check_lead_zeros_and_plus_sign(self, value, parsed):
+        if _PLUS_SIGN_OR_LEAD_ZEROS(value):
             raise InvalidQueryParameter()
 
 
 class Int(Number):
+    __slots__ = ()
+
     def __new__(cls, name, **kwargs):
         # REVIEW: Is this implicit behaviour required?
         if kwargs.get("min_value") == 0:
             return PositiveInt(name, **kwargs)
         return super().__new__(cls)
 
-    def parse(self, value):
+    # Builtins are bound as defaults so lookups are local in the hot path
+    def parse(self, value, _int=int, _invalid=InvalidQueryParameter):
         try:
-            return int(value)
+            return _int(value)
         except ValueError:
-            raise InvalidQueryParameter()
+            raise _invalid()
 
 
 class PositiveInt(Int):
-    def __init__(self, name, **kwargs):
-        if kwargs.get("min_value", 0) < 0:
-            raise ValueError()
-
-        super().__init__(name, **kwargs)
+    __slots__ = ()
 
-        # REVIEW:
-        # self.min_value = 0
-        # self._value_checks.append(self._check_lower_bound)
+    # Negative bounds are rejected by `parse`, see `BoundedParam._parse_bound`
+    # REVIEW:
+    # self.min_value = 0
+    # self._value_checks.append(self._check_lower_bound)
 
-    def parse(self, value):
+    def parse(self, value, _int=int, _invalid=InvalidQueryParameter):
         try:
-            parsed = int(value)
-        except ValueError:
-            raise InvalidQueryParameter()
-        else:
-            if parsed < 0:
-                raise InvalidQueryParameter()
-            return parsed
+            parsed = _int(value)
+        except ValueError:  # also raised past the int max str digits limit
+            raise _invalid()
+        if parsed < 0:
+            raise _invalid()
+        return parsed
 
 
 class Float(Number):
+    __slots__ = ()
+
     def __new__(cls, name, **kwargs):
         if kwargs.get("min_value") == 0:
             return PositiveFloat(name, **kwargs)
         return super().__new__(cls)
 
-    def parse(self, value):
+    def parse(self, value, _float=float, _invalid=InvalidQueryParameter):
         try:
-            return float(value)
+            return _float(value)
         except ValueError:
-            raise InvalidQueryParameter()
+            raise _invalid()
 
 
 class PositiveFloat(Float):
-    def __init__(self, name, **kwargs):
-        if kwargs.get("min_value", 0) < 0:
-            raise ValueError()
+    __slots__ = ()
 
-        super().__init__(name, **kwargs)
+    # Negative bounds are rejected by `parse`, see `BoundedParam._parse_bound`
 
-    def parse(self, value):
+    def parse(self, value, _float=float, _invalid=InvalidQueryParameter):
         try:
-            parsed = float(value)
+            parsed = _float(value)
         except ValueError:
-            raise InvalidQueryParameter()
-        else:
-            if parsed < 0:
-                raise InvalidQueryParameter()
-            return parsed
+            raise _invalid()
+        if parsed < 0:
+            raise _invalid()
+        return parsed
 
 
 class Str(QueryParam):
+    __slots__ = ("min_length", "max_length")
+
+    # (min_length given, max_length given) -> check
+    _LENGTH_CHECKS = {
+        (True, True): "_check_min_and_max_length",
+        (True, False): "_check_min_length",
+        (False, True): "_check_max_length",
+    }
+
     def __init__(self, name, *, min_length=None, max_length=None, **kwargs):
         super().__init__(name, **kwargs)
 
@@ -277,19 +507,18 @@ class Str(QueryParam):
         self.min_length = min_length
 
         if max_length:
-            if not isinstance(max_length, int) or min_length < 1:
+            if not isinstance(max_length, int) or max_length < 1:
                 raise ValueError("'max_length' must be a natural number(> 0)")
-        self.min_length = min_length
+        self.max_length = max_length
 
         if min_length and max_length and (max_length < min_length):
             raise ValueError("'max_length' must be >= 'min_length'")
 
-        if min_length is not None and max_length is not None:
-            self._value_checks.append(self._check_min_and_max_length)
-        elif min_length is not None:
-            self._value_checks.append(self._check_min_length)
-        elif max_length is not None:
-            self._value_checks.append(self._check_max_length)
+        check = self._LENGTH_CHECKS.get(
+            (min_length is not None, max_length is not None)
+        )
+        if check:
+            self._value_checks.append(getattr(self, check))
 
     def parse(self, value):
         return value
@@ -298,20 +527,25 @@ class Str(QueryParam):
         if not self.allow_empty and len(value) == 0:
             raise InvalidQueryParameter()
 
-    def check_min_length(self, value, parsed):
-        if not len(value) < self.min_length:
+    @_inlinable
+    def _check_min_length(self, value, parsed):
+        if len(value) < self.min_length:
             raise InvalidQueryParameter()
 
-    def check_max_length(self, value, parsed):
-        if not len(value) > self.max_length:
+    @_inlinable
+    def _check_max_length(self, value, parsed):
+        if len(value) > self.max_length:
             raise InvalidQueryParameter()
 
-    def check_min_and_max_length(self, value, parsed):
-        if not (self.min_length <= len(value) <= self.max_length):
+    @_inlinable
+    def _check_min_and_max_length(self, value, parsed):
+        if len(value) < self.min_length or len(value) > self.max_length:
             raise InvalidQueryParameter()
 
 
 class Date(BoundedParam):
+    __slots__ = ("separator",)
+
     def __init__(self, name, *, separator="-", **kwargs):
         if separator not in ("-", "/"):
             raise ValueError()
@@ -320,16 +554,39 @@ class Date(BoundedParam):
 
         super().__init__(name, **kwargs)
 
-    def parse(self, value):
+    def parse(
+        self, value, _fromisoformat=date.fromisoformat, _invalid=InvalidQueryParameter
+    ):
         if self.separator != "-":
             value = value.replace(self.separator, "-")
         try:
-            return date.fromisoformat(value)
+            return _fromisoformat(value)
         except ValueError:
-            raise InvalidQueryParameter()
+            raise _invalid()
+
+    def _specialized_parse(self):
+        # The separator is fixed, pick a parse that needn't check it per value
+        if type(self).parse is not Date.parse:
+            return self.parse
+        separator = self.separator
+
+        def parse(
+            value, _fromisoformat=date.fromisoformat, _invalid=InvalidQueryParameter
+        ):
+            try:
+                return _fromisoformat(value)
+            except ValueError:
+                raise _invalid()
+
+        def parse_separated(value, _parse=parse):
+            return _parse(value.replace(separator, "-"))
+
+        return parse if separator == "-" else parse_separated
 
 
 class Bool(QueryParam):
+    __slots__ = ("truthy", "falsy", "explicit", "ignore_case", "_bools")
+
     def __init__(
         self,
         name,
@@ -339,7 +596,7 @@ class Bool(QueryParam):
         ignore_case=True,
         custom_bool=None,
     ):
-        if not isinstance(name, str):
+        if __debug__ and not isinstance(name, str):
             raise TypeError(f"'name' must be string, not '{type(name)}'")
         self.name = name
 
@@ -361,6 +618,11 @@ class Bool(QueryParam):
                 raise ValueError()
             self.truthy, self.falsy = custom_bool
 
+        if ignore_case:
+            self._bools = {self.truthy.lower(): True, self.falsy.lower(): False}
+        else:
+            self._bools = {self.truthy: True, self.falsy: False}
+
     def validate_all(self, values):
         # TODO: what if multiple values are passed?
         # For the time being, consider the last value as the correct one
@@ -369,11 +631,37 @@ class Bool(QueryParam):
             return [True]  # TODO: Review
         if self.ignore_case:
             value = value.lower()
-        if value == self.truthy:
-            return [True]
-        elif value == self.falsy:
-            return [False]
-        else:
+        parsed = self._bools.get(value)
+        if parsed is None:
             raise InvalidQueryParameter(
                 f"Expected one of [{self.truthy}, {self.falsy}], got '{value}'"
             )
+        return [parsed]
+
+    def _specialize(self):
+        # `validate_all` is self-contained, there's nothing to specialize
+        pass
+
+
+@lru_cache(maxsize=1024)
+def _cached_param(cls, name, kwargs):
+    return cls(name, **{key: value for key, _, value in kwargs})
+
+
+def param(cls, name, **kwargs):
+    """
+    Return `cls(name, **kwargs)`, shared with identical earlier declarations.
+
+    Params are read-only once initialized, so endpoints declaring the same param
+    can reuse a single instance instead of rebuilding it. List arguments are
+    converted to tuples, all the other arguments must be hashable.
+    """
+    # The value's type is part of the key, so that equal values of different
+    # types (`1` and `True`) are validated separately, as `cls(...)` would
+    frozen = tuple(
+        sorted(
+            (key, type(value), tuple(value) if isinstance(value, list) else value)
+            for key, value in kwargs.items()
+        )
+    )
+    return _cached_param(cls, name, frozen)
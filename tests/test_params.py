@@ -0,0 +1,148 @@
+import unittest
+from datetime import date
+from itertools import product
+
+from django_queryparams_parser.params import (
+    Date,
+    Float,
+    Int,
+    InvalidQueryParameter,
+    PositiveInt,
+    Str,
+    _club_checks,
+    _inlinable,
+)
+
+NUMBERS = [
+    "0", "1", "5", "7", "10", "42", "100", "-3", "+5", "05", "-05", " 05",
+    "0_5", "1_0", " 7 ", "1.5", "-0.5", "+0.5", "00.5", "abc", "", "1e3",
+]  # fmt: skip
+STRINGS = ["", "a", "ab", "abc", "abcd", "abcdef", " ab ", "b"]
+DATES = [
+    "2024-01-02", "2024/01/02", "2023-12-31", "2023/12/31", "2024-13-01",
+    "2024/02/30", "2025-06-01", "2024-01", "x", "",
+]  # fmt: skip
+
+
+def _outcome(validate, value):
+    try:
+        return validate(value)
+    except InvalidQueryParameter:
+        return InvalidQueryParameter
+
+
+class ClubbedChecksTest(unittest.TestCase):
+    """The specialized `_validate` must behave exactly like `validate_single`"""
+
+    def assert_same_outcomes(self, param, values):
+        for value in values:
+            with self.subTest(param=param.name, value=value):
+                self.assertEqual(
+                    _outcome(param._validate, value),
+                    _outcome(param.validate_single, value),
+                )
+
+    def test_numbers(self):
+        bounds = [{}, {"min_value": 5}, {"max_value": 42}]
+        bounds.append({"min_value": 5, "max_value": 42})
+        for cls, bound, lead_zeros, plus_sign in product(
+            [Int, PositiveInt, Float], bounds, [True, False], [True, False]
+        ):
+            param = cls(
+                f"{cls.__name__}-{bound}-{lead_zeros}-{plus_sign}",
+                allow_lead_zeros=lead_zeros,
+                allow_plus_sign=plus_sign,
+                **bound,
+            )
+            self.assertNotEqual(param._validate, param.validate_single)
+            self.assert_same_outcomes(param, NUMBERS)
+
+    def test_number_choices(self):
+        for cls, lead_zeros, plus_sign in product(
+            [Int, Float], [True, False], [True, False]
+        ):
+            param = cls(
+                f"{cls.__name__}-{lead_zeros}-{plus_sign}",
+                choices=["5", "05", "+7", "10"],
+                allow_lead_zeros=lead_zeros,
+                allow_plus_sign=plus_sign,
+            )
+            self.assert_same_outcomes(param, NUMBERS)
+
+    def test_str(self):
+        lengths = [{}, {"min_length": 2}, {"max_length": 4}]
+        lengths.append({"min_length": 2, "max_length": 4})
+        for length in lengths:
+            param = Str(f"str-{length}", **length)
+            self.assertNotEqual(param._validate, param.validate_single)
+            self.assert_same_outcomes(param, STRINGS)
+        self.assert_same_outcomes(Str("choices", choices=["a", "abc"]), STRINGS)
+
+    def test_date(self):
+        bounds = [{}, {"min_value": date(2024, 1, 1)}, {"max_value": "2024-06-30"}]
+        bounds.append({"min_value": "2024-01-01", "max_value": date(2024, 6, 30)})
+        for separator, bound in product(["-", "/"], bounds):
+            param = Date(f"date-{separator}-{bound}", separator=separator, **bound)
+            self.assertIs(type(param), Date)
+            self.assertNotEqual(param._validate, param.validate_single)
+            self.assert_same_outcomes(param, DATES)
+        for separator in ["-", "/"]:
+            param = Date(
+                f"date-choices-{separator}",
+                separator=separator,
+                choices=["2023-12-31", f"2024{separator}01{separator}02"],
+            )
+            self.assert_same_outcomes(param, DATES)
+
+    def test_date_subclass_keeps_separator(self):
+        class MyDate(Date):
+            __slots__ = ()
+
+        param = MyDate("date", separator="/")
+        self.assertEqual(param.validate_all(["2024/01/02"]), [date(2024, 1, 2)])
+        self.assert_same_outcomes(param, DATES)
+
+
+class EvenInt(Int):
+    __slots__ = ()
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self._value_checks.append(self._check_even)
+
+    @_inlinable
+    def _check_even(self, value, parsed):
+        if parsed % 2 == 0:
+            return
+        raise InvalidQueryParameter()
+
+
+class UnclubbableChecksTest(unittest.TestCase):
+    def test_checks_outside_params_module_are_not_clubbed(self):
+        self.assertIsNone(_club_checks((EvenInt._check_even,)))
+
+    def test_falls_back_to_validate_single(self):
+        param = EvenInt("even", min_value=2)
+        self.assertEqual(param._validate, param.validate_single)
+        self.assertEqual(param.validate_all(["4"]), [4])
+        for value in ["3", "0", "x"]:
+            with self.subTest(value=value):
+                with self.assertRaises(InvalidQueryParameter):
+                    param.validate_all([value])
+
+
+class BoundsTest(unittest.TestCase):
+    def test_bounds_may_be_strings(self):
+        param = PositiveInt("p", min_value="5", max_value="10")
+        self.assertEqual((param.min_value, param.max_value), (5, 10))
+
+    def test_invalid_bounds_raise_value_error(self):
+        for make in [
+            lambda: Int("i", min_value=1.5),
+            lambda: Int("i", max_value="x"),
+            lambda: PositiveInt("p", min_value=-1),
+            lambda: Float("f", min_value="-0.5", max_value="-1"),
+            lambda: Date("d", min_value="2024-13-01"),
+        ]:
+            with self.assertRaises(ValueError):
+                make()